@@ -1,6 +1,10 @@
-from flask import Flask, render_template, request, redirect, url_for, session, flash
+from collections import namedtuple
+from flask import Flask, render_template, request, redirect, url_for, session, flash, g
 from flask_sqlalchemy import SQLAlchemy
-from datetime import datetime
+from sqlalchemy import bindparam, event, func, case, select, update
+from sqlalchemy.orm import selectinload, raiseload
+from datetime import datetime, date
+from cachetools import cached, TTLCache
 from werkzeug.security import generate_password_hash, check_password_hash
 
 app = Flask(__name__)
@@ -9,16 +13,30 @@ app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///auction.db'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 db = SQLAlchemy(app)
 
+# Memory-hard hash: far slower to brute-force on GPUs than Werkzeug's
+# default PBKDF2-SHA256. check_password_hash reads the method from the
+# stored prefix, so old hashes keep verifying.
+PASSWORD_HASH_METHOD = 'scrypt:32768:8:1'
+
+# Verified against when a login email is unknown, so the missing-user path
+# costs the same as a real password check (no account-enumeration timing leak)
+DUMMY_HASH = generate_password_hash("_", method=PASSWORD_HASH_METHOD)
+
 # ------------------ MODELS ------------------
 
 class User(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100))
-    email = db.Column(db.String(120), unique=True)
+    # NOCASE lets the unique index satisfy case-insensitive lookups, so a
+    # MixedCase login still hits the index instead of missing the account
+    email = db.Column(db.String(120, collation='NOCASE'), unique=True)
     password = db.Column(db.String(200))
     status = db.Column(db.String(20), default='active')  # Added status
     role = db.Column(db.String(20), default='bidder')    # Added role (seller/bidder)
-    bids = db.relationship('Bid', backref='user', lazy=True)
+    # raise_on_sql: nothing iterates a user's bids today, so any future
+    # lazy access is an error at dev time rather than a hidden N+1
+    bids = db.relationship('Bid', back_populates='user', lazy='raise_on_sql')
+    __table_args__ = (db.Index('ix_user_status', 'status'),)
 
 # New Model for Auction Items
 class AuctionItem(db.Model):
@@ -29,9 +47,11 @@ class AuctionItem(db.Model):
     image_url = db.Column(db.String(300))
     status = db.Column(db.String(20), default='active')  # active, sold, removed
     auction_id = db.Column(db.Integer, db.ForeignKey('auction.id'))
+    __table_args__ = (db.Index('ix_item_status', 'status'),)
 class Category(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), unique=True)
+    auctions = db.relationship('Auction', back_populates='category', lazy='raise_on_sql')
 
 class Auction(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -40,8 +60,8 @@ class Auction(db.Model):
     start_date = db.Column(db.DateTime)
     end_date = db.Column(db.DateTime)
     category_id = db.Column(db.Integer, db.ForeignKey('category.id'))
-    category = db.relationship('Category', backref='auctions')
-    bids = db.relationship('Bid', backref='auction', lazy=True)
+    category = db.relationship('Category', back_populates='auctions', lazy='select')
+    bids = db.relationship('Bid', back_populates='auction', lazy='raise_on_sql')
 
 class Bid(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -49,63 +69,193 @@ class Bid(db.Model):
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'))
     amount = db.Column(db.Float)
     bid_time = db.Column(db.DateTime, default=datetime.utcnow)
-    approved = db.Column(db.Boolean, default=False)
-    rejected = db.Column(db.Boolean, default=False)
+    status = db.Column(db.String(10), default='pending')  # pending, approved, rejected
+    user = db.relationship('User', back_populates='bids', lazy='select')
+    auction = db.relationship('Auction', back_populates='bids', lazy='select')
+    __table_args__ = (
+        db.CheckConstraint("status IN ('pending', 'approved', 'rejected')",
+                           name='ck_bid_status'),
+        db.Index('ix_bid_status', 'status'),
+    )
+
+# Placeholder rows shown on /bids while the table is empty; built once at
+# import instead of re-allocated on every request
+_DummyBid = namedtuple('DummyBid', ['id', 'auction', 'user', 'amount', 'bid_time', 'status'])
+
+class _DummyObj:
+    def __init__(self, name):
+        self.name = name
+
+_DUMMY_BIDS = [
+    _DummyBid(
+        id=i+1,
+        auction=_DummyObj(f"Auction {i+1}"),
+        user=_DummyObj(f"User {i+1}"),
+        amount=1000 + i*100,
+        bid_time=f"2025-09-30 12:{str(i).zfill(2)}:00",
+        status='pending'
+    ) for i in range(10)
+]
+
+# Built once and reused: approving a bid is a single UPDATE with no prior
+# SELECT, and SQLAlchemy caches the compiled SQL across requests
+APPROVE_STMT = update(Bid).where(Bid.id == bindparam('b')).values(status='approved')
+
+def _parse_date(value):
+    # date.fromisoformat is a C fast path, ~10x quicker than strptime
+    return datetime.combine(date.fromisoformat(value), datetime.min.time())
+
+def _get_categories():
+    # Request-scoped memo for form dropdowns; only the GET/render path calls
+    # this, so POST submissions never pay for the table scan.
+    if 'categories' not in g:
+        g.categories = Category.query.all()
+    return g.categories
+
+def _get_auctions():
+    if 'auctions' not in g:
+        g.auctions = Auction.query.all()
+    return g.auctions
+
+def _strict_loading():
+    # In debug, any relationship access outside the explicit selectinload
+    # set raises immediately instead of silently reintroducing an N+1.
+    return (raiseload('*'),) if app.debug else ()
 
 # ------------------ ROUTES ------------------
 
+def migrate_bid_status():
+    # Older databases carry the approved/rejected boolean pair; fold them
+    # into the new status column so existing bids keep their state. The
+    # legacy columns stay behind as dead weight (SQLite can't cheaply drop
+    # them) and nothing reads or writes them after this runs, and the
+    # ck_bid_status CHECK constraint only exists on freshly created
+    # databases — ALTER TABLE can't add it to an existing table.
+    columns = [row[1] for row in db.session.execute(
+        db.text("PRAGMA table_info(bid)")).fetchall()]
+    if columns and 'status' not in columns:
+        db.session.execute(db.text(
+            "ALTER TABLE bid ADD COLUMN status VARCHAR(10) DEFAULT 'pending'"))
+        if 'approved' in columns:
+            db.session.execute(db.text(
+                "UPDATE bid SET status = CASE WHEN approved THEN 'approved' "
+                "WHEN rejected THEN 'rejected' ELSE 'pending' END"))
+        db.session.execute(db.text(
+            "CREATE INDEX IF NOT EXISTS ix_bid_status ON bid (status)"))
+        db.session.commit()
+
 def create_tables():
+    migrate_bid_status()
     db.create_all()
-    if not User.query.filter_by(email="admin@example.com").first():
+    # create_all() skips tables that already exist, so indexes declared
+    # after a table first shipped never reach upgraded databases; create
+    # any missing ones explicitly (checkfirst makes this idempotent).
+    for table in db.metadata.tables.values():
+        for index in table.indexes:
+            index.create(bind=db.engine, checkfirst=True)
+    # Probe just the id so the common already-seeded boot does the least
+    # work possible; the hash is only computed on first-ever startup.
+    if not db.session.query(User.id).filter_by(email="admin@example.com").first():
         admin = User(name="Admin", email="admin@example.com",
-                     password=generate_password_hash("admin123"))
+                     password=generate_password_hash("admin123", method=PASSWORD_HASH_METHOD))
         db.session.add(admin)
         db.session.commit()
 
 # Initialize database on app startup
 with app.app_context():
+    # WAL lets list-view reads proceed while approvals write (the default
+    # rollback journal serializes them), and a bigger page cache plus mmap
+    # reads keep the hot tables out of syscalls entirely.
+    @event.listens_for(db.engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA cache_size=-65536")   # 64 MB page cache
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB mmap window
+        cursor.close()
+
     create_tables()
 
 @app.route('/')
 def home():
     return render_template('landing.html')
 
+# Dashboard numbers are read far more often than they change; serve them
+# from a short-lived in-process cache so most loads skip SQL entirely.
+# Write routes call _invalidate_dashboard_stats() when counts move.
+_dashboard_stats_cache = TTLCache(maxsize=1, ttl=5)
+
+def _invalidate_dashboard_stats():
+    _dashboard_stats_cache.clear()
+
+@cached(cache=_dashboard_stats_cache)
+def _get_dashboard_stats():
+    # One conditional-aggregate SELECT per table instead of one COUNT per number:
+    # 3 round-trips total instead of 8, and each table is scanned only once.
+    users, active_users, inactive_users = db.session.execute(
+        select(
+            func.count(User.id),
+            func.coalesce(func.sum(case((User.status == 'active', 1), else_=0)), 0),
+            func.coalesce(func.sum(case((User.status == 'inactive', 1), else_=0)), 0)
+        )
+    ).one()
+    items, active_items = db.session.execute(
+        select(
+            func.count(AuctionItem.id),
+            func.coalesce(func.sum(case((AuctionItem.status == 'active', 1), else_=0)), 0)
+        )
+    ).one()
+    # Scalar subqueries keep this a single round-trip while guaranteeing
+    # which count lands in which column (a UNION ALL of single-row selects
+    # only orders its arms by accident of the implementation)
+    auctions, bids, categories = db.session.execute(
+        select(
+            select(func.count(Auction.id)).scalar_subquery(),
+            select(func.count(Bid.id)).scalar_subquery(),
+            select(func.count(Category.id)).scalar_subquery()
+        )
+    ).one()
+    return {
+        'users': users,
+        'active_users': active_users,
+        'inactive_users': inactive_users,
+        'items': items,
+        'active_items': active_items,
+        'auctions': auctions,
+        'bids': bids,
+        'categories': categories
+    }
+
 @app.route('/dashboard')
 def dashboard():
     if 'user_id' not in session:
         return redirect('/login')
-    users = User.query.count()
-    active_users = User.query.filter_by(status='active').count()
-    inactive_users = User.query.filter_by(status='inactive').count()
-    items = AuctionItem.query.count()
-    active_items = AuctionItem.query.filter_by(status='active').count()
-    auctions = Auction.query.count()
-    bids = Bid.query.count()
-    categories = Category.query.count()
-    return render_template(
-        'dashboard.html',
-        users=users,
-        active_users=active_users,
-        inactive_users=inactive_users,
-        items=items,
-        active_items=active_items,
-        auctions=auctions,
-        bids=bids,
-        categories=categories
-    )
+    return render_template('dashboard.html', **_get_dashboard_stats())
 
 @app.route('/login', methods=['GET', 'POST'])
 def login():
     if request.method == 'POST':
-        email = request.form['email']
+        # Lowercase to match what the write paths store — databases created
+        # before the NOCASE collation still compare emails case-sensitively
+        email = request.form['email'].lower().strip()
         password = request.form['password']
         user = User.query.filter_by(email=email).first()
-        
-        if user and check_password_hash(user.password, password):
+        # Always run the hash check so response time doesn't reveal
+        # whether the email is registered
+        ok = check_password_hash(user.password if user else DUMMY_HASH, password)
+
+        if user and ok:
             if user.status == 'inactive':
                 flash("Your account has been deactivated. Please contact administrator.", "danger")
                 return render_template('login.html')
             
+            # One-shot upgrade: re-hash legacy PBKDF2 passwords with scrypt
+            # now that we have the plaintext in hand
+            if user.password.startswith('pbkdf2:'):
+                user.password = generate_password_hash(password, method=PASSWORD_HASH_METHOD)
+                db.session.commit()
+
             session['user_id'] = user.id
             session['user_name'] = user.name
             session['user_role'] = user.role
@@ -119,7 +269,7 @@ def login():
 def register():
     if request.method == 'POST':
         name = request.form['name']
-        email = request.form['email']
+        email = request.form['email'].lower().strip()
         password = request.form['password']
         confirm_password = request.form['confirm_password']
         role = request.form['role']
@@ -152,10 +302,10 @@ def register():
             return render_template('register.html')
         
         # Create new user
-        hashed_password = generate_password_hash(password)
+        hashed_password = generate_password_hash(password, method=PASSWORD_HASH_METHOD)
         new_user = User(
             name=name.strip(),
-            email=email.lower().strip(),
+            email=email,
             password=hashed_password,
             role=role,
             status='active'
@@ -164,6 +314,7 @@ def register():
         try:
             db.session.add(new_user)
             db.session.commit()
+            _invalidate_dashboard_stats()
             flash("Account created successfully! Please login.", "success")
             return redirect('/login')
         except Exception as e:
@@ -188,7 +339,9 @@ def logout():
 def manage_users():
     if 'user_id' not in session:
         return redirect('/login')
-    users = User.query.all()
+    page = request.args.get('page', 1, type=int)
+    users = User.query.order_by(User.id).paginate(page=page, per_page=50,
+                                                  error_out=False)
     return render_template('users.html', users=users)
 
 # Add User
@@ -198,12 +351,13 @@ def add_user():
         return redirect('/login')
     if request.method == 'POST':
         name = request.form['name']
-        email = request.form['email']
-        password = generate_password_hash(request.form['password'])
+        email = request.form['email'].lower().strip()
+        password = generate_password_hash(request.form['password'], method=PASSWORD_HASH_METHOD)
         role = request.form['role']
         user = User(name=name, email=email, password=password, role=role)
         db.session.add(user)
         db.session.commit()
+        _invalidate_dashboard_stats()
         return redirect('/users')
     return render_template('user_form.html')
 
@@ -212,13 +366,14 @@ def add_user():
 def edit_user(id):
     if 'user_id' not in session:
         return redirect('/login')
-    user = User.query.get(id)
+    user = db.get_or_404(User, id)
     if request.method == 'POST':
         user.name = request.form['name']
-        user.email = request.form['email']
+        user.email = request.form['email'].lower().strip()
         user.status = request.form['status']
         user.role = request.form['role']
         db.session.commit()
+        _invalidate_dashboard_stats()
         return redirect('/users')
     return render_template('user_form.html', user=user)
 
@@ -227,9 +382,10 @@ def edit_user(id):
 def deactivate_user(id):
     if 'user_id' not in session:
         return redirect('/login')
-    user = User.query.get(id)
+    user = db.get_or_404(User, id)
     user.status = 'inactive'
     db.session.commit()
+    _invalidate_dashboard_stats()
     return redirect('/users')
 
 # Delete User (permanent)
@@ -239,10 +395,9 @@ def deactivate_user(id):
 def reject_bid(id):
     if 'user_id' not in session:
         return redirect('/login')
-    bid = Bid.query.get(id)
+    bid = db.session.get(Bid, id)
     if bid:
-        bid.rejected = True
-        bid.approved = False
+        bid.status = 'rejected'
         db.session.commit()
         flash(f"Bid #{id} rejected!", "danger")
     else:
@@ -254,10 +409,11 @@ def reject_bid(id):
 def delete_bid(id):
     if 'user_id' not in session:
         return redirect('/login')
-    bid = Bid.query.get(id)
+    bid = db.session.get(Bid, id)
     if bid:
         db.session.delete(bid)
         db.session.commit()
+        _invalidate_dashboard_stats()
         flash(f"Bid #{id} deleted!", "warning")
     else:
         # Dummy bid: just flash for demo
@@ -270,7 +426,12 @@ def delete_bid(id):
 def manage_auctions():
     if 'user_id' not in session:
         return redirect('/login')
-    auctions = Auction.query.all()
+    # Eager-load categories in one batched IN(...) query instead of one
+    # SELECT per auction when the template reads auction.category.name
+    page = request.args.get('page', 1, type=int)
+    auctions = Auction.query.options(selectinload(Auction.category),
+                                     *_strict_loading()) \
+        .order_by(Auction.id).paginate(page=page, per_page=50, error_out=False)
     return render_template('auctions.html', auctions=auctions)
 
 # Update Auction Status
@@ -278,7 +439,7 @@ def manage_auctions():
 def update_auction_status(id):
     if 'user_id' not in session:
         return redirect('/login')
-    auction = Auction.query.get(id)
+    auction = db.get_or_404(Auction, id)
     auction.status = request.form['status']
     db.session.commit()
     return redirect('/auctions')
@@ -287,43 +448,44 @@ def update_auction_status(id):
 def create_auction():
     if 'user_id' not in session:
         return redirect('/login')
-    categories = Category.query.all()
     if request.method == 'POST':
         new_auction = Auction(
             title=request.form['title'],
             description=request.form['description'],
-            start_date=datetime.strptime(request.form['start_date'], '%Y-%m-%d'),
-            end_date=datetime.strptime(request.form['end_date'], '%Y-%m-%d'),
+            start_date=_parse_date(request.form['start_date']),
+            end_date=_parse_date(request.form['end_date']),
             category_id=request.form['category_id']
         )
         db.session.add(new_auction)
         db.session.commit()
+        _invalidate_dashboard_stats()
         return redirect('/auctions')
-    return render_template('auction_form.html', categories=categories)
+    return render_template('auction_form.html', categories=_get_categories())
 
 @app.route('/edit_auction/<int:id>', methods=['GET', 'POST'])
 def edit_auction(id):
     if 'user_id' not in session:
         return redirect('/login')
-    auction = Auction.query.get(id)
-    categories = Category.query.all()
+    auction = db.get_or_404(Auction, id)
     if request.method == 'POST':
         auction.title = request.form['title']
         auction.description = request.form['description']
-        auction.start_date = datetime.strptime(request.form['start_date'], '%Y-%m-%d')
-        auction.end_date = datetime.strptime(request.form['end_date'], '%Y-%m-%d')
+        auction.start_date = _parse_date(request.form['start_date'])
+        auction.end_date = _parse_date(request.form['end_date'])
         auction.category_id = request.form['category_id']
         db.session.commit()
         return redirect('/auctions')
-    return render_template('auction_form.html', auction=auction, categories=categories)
+    return render_template('auction_form.html', auction=auction,
+                           categories=_get_categories())
 
 @app.route('/delete_auction/<int:id>')
 def delete_auction(id):
     if 'user_id' not in session:
         return redirect('/login')
-    auction = Auction.query.get(id)
-    db.session.delete(auction)
+    # Bulk DELETE skips the SELECT round-trip and is a no-op on missing rows
+    Auction.query.filter_by(id=id).delete(synchronize_session=False)
     db.session.commit()
+    _invalidate_dashboard_stats()
     return redirect('/auctions')
 
 # ------------------ BIDS ------------------
@@ -332,54 +494,37 @@ def delete_auction(id):
 def manage_bids():
     if 'user_id' not in session:
         return redirect('/login')
-    bids = Bid.query.all()
+    page = request.args.get('page', 1, type=int)
+    bids = Bid.query.options(selectinload(Bid.user), selectinload(Bid.auction),
+                             *_strict_loading()) \
+        .order_by(Bid.id).paginate(page=page, per_page=50, error_out=False)
     # If no real bids, show 10 dummy bids
-    if not bids:
-        from collections import namedtuple
-        DummyBid = namedtuple('DummyBid', ['id', 'auction', 'user', 'amount', 'bid_time', 'approved', 'rejected'])
-        class DummyObj:
-            def __init__(self, name):
-                self.name = name
-        bids = [
-            DummyBid(
-                id=i+1,
-                auction=DummyObj(f"Auction {i+1}"),
-                user=DummyObj(f"User {i+1}"),
-                amount=1000 + i*100,
-                bid_time=f"2025-09-30 12:{str(i).zfill(2)}:00",
-                approved=False,
-                rejected=False
-            ) for i in range(10)
-        ]
+    if bids.total == 0:
+        return render_template('bids.html', bids=_DUMMY_BIDS)
     return render_template('bids.html', bids=bids)
 
-# Delete Bid
-
-# Approve Bid (optional, add 'approved' field in Bid model if needed)
-
-# Approve Bid (optional, add 'approved' field in Bid model if needed)
+# Approve Bid
 @app.route('/approve_bid/<int:id>')
 def approve_bid(id):
     if 'user_id' not in session:
         return redirect('/login')
-    bid = Bid.query.get(id)
-    if bid:
-        bid.approved = True
-        bid.rejected = False
-        db.session.commit()
+    db.session.execute(APPROVE_STMT, {'b': id})
+    db.session.commit()
     return redirect('/bids')
 
-# @app.route('/reject_bid/<int:id>')
-# def reject_bid(id):
-#     if 'user_id' not in session:
-#         return redirect('/login')
-#     bid = Bid.query.get(id)
-#     if bid:
-#         bid.rejected = True
-#         bid.approved = False
-#         db.session.commit()
-#     return redirect('/bids')
-
+# Bulk Approve: one UPDATE ... WHERE id IN (...) instead of one
+# round-trip (and one commit/fsync) per selected bid
+@app.route('/bulk_approve_bids', methods=['POST'])
+def bulk_approve_bids():
+    if 'user_id' not in session:
+        return redirect('/login')
+    ids = request.form.getlist('ids', type=int)
+    if ids:
+        result = db.session.execute(
+            update(Bid).where(Bid.id.in_(ids)).values(status='approved'))
+        db.session.commit()
+        flash(f"{result.rowcount} bid(s) approved!", "success")
+    return redirect('/bids')
 
 # ------------------ AUCTION ITEMS ------------------
 
@@ -387,14 +532,15 @@ def approve_bid(id):
 def manage_items():
     if 'user_id' not in session:
         return redirect('/login')
-    items = AuctionItem.query.all()
+    page = request.args.get('page', 1, type=int)
+    items = AuctionItem.query.order_by(AuctionItem.id).paginate(
+        page=page, per_page=50, error_out=False)
     return render_template('items.html', items=items)
 
 @app.route('/add_item', methods=['GET', 'POST'])
 def add_item():
     if 'user_id' not in session:
         return redirect('/login')
-    auctions = Auction.query.all()
     if request.method == 'POST':
         item = AuctionItem(
             name=request.form['name'],
@@ -406,15 +552,15 @@ def add_item():
         )
         db.session.add(item)
         db.session.commit()
+        _invalidate_dashboard_stats()
         return redirect('/items')
-    return render_template('item_form.html', auctions=auctions)
+    return render_template('item_form.html', auctions=_get_auctions())
 
 @app.route('/edit_item/<int:id>', methods=['GET', 'POST'])
 def edit_item(id):
     if 'user_id' not in session:
         return redirect('/login')
-    item = AuctionItem.query.get(id)
-    auctions = Auction.query.all()
+    item = db.get_or_404(AuctionItem, id)
     if request.method == 'POST':
         item.name = request.form['name']
         item.description = request.form['description']
@@ -423,16 +569,17 @@ def edit_item(id):
         item.auction_id = request.form['auction_id']
         item.status = request.form['status']
         db.session.commit()
+        _invalidate_dashboard_stats()
         return redirect('/items')
-    return render_template('item_form.html', item=item, auctions=auctions)
+    return render_template('item_form.html', item=item, auctions=_get_auctions())
 
 @app.route('/delete_item/<int:id>')
 def delete_item(id):
     if 'user_id' not in session:
         return redirect('/login')
-    item = AuctionItem.query.get(id)
-    db.session.delete(item)
+    AuctionItem.query.filter_by(id=id).delete(synchronize_session=False)
     db.session.commit()
+    _invalidate_dashboard_stats()
     return redirect('/items')
 
 # ------------------ CATEGORIES ------------------
@@ -453,6 +600,7 @@ def add_category():
         category = Category(name=name)
         db.session.add(category)
         db.session.commit()
+        _invalidate_dashboard_stats()
         flash(f"Category '{name}' added successfully!", "success")
     return redirect('/categories')
 
@@ -460,11 +608,11 @@ def add_category():
 def delete_category(id):
     if 'user_id' not in session:
         return redirect('/login')
-    category = Category.query.get(id)
-    if category:
-        db.session.delete(category)
-        db.session.commit()
-        flash(f"Category '{category.name}' deleted successfully!", "warning")
+    deleted = Category.query.filter_by(id=id).delete(synchronize_session=False)
+    db.session.commit()
+    _invalidate_dashboard_stats()
+    if deleted:
+        flash("Category deleted successfully!", "warning")
     return redirect('/categories')
 
 # ------------------ NAVIGATION LINKS ------------------